@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""Build an importable exam file from a plain vocabulary list.
+
+Each input line pairs a term with its English gloss, separated by a tab,
+a colon, a spaced dash, or a run of two or more spaces:
+
+    grammatica, grammaticae, f.	grammar
+    poeta, poetae, m. : poet
+    insula, insulae, f. - island
+
+Blank lines and lines starting with "#" are skipped. The output follows the
+web app's import format (see "Import Format" in README.md), so the generated
+file can be loaded straight into the exam library.
+
+Usage:
+    python tools/mcq_generator.py vocab.txt -o exam.txt --title "Latin Vocabulary Exam"
+"""
+
+from __future__ import annotations
+
+import argparse
+import mmap
+import random
+import re
+from pathlib import Path
+
+# Matches a whole "term<sep>gloss" line; the lazy term group makes the engine
+# split at the earliest separator, mirroring split_line. Compiled over bytes
+# so it can run directly on the mmap'd file.
+_LINE_RE = re.compile(rb"^(?!\s*#)([^\t:\n]+?)(?:\t| *: *| +- +| {2,})(.+)$", re.M)
+
+# Pads the option pool when the vocabulary is too small to supply three
+# plausible wrong answers on its own.
+FALLBACK_DISTRACTORS = (
+    "water", "fire", "road", "mountain", "shield", "horse",
+    "king", "night", "hand", "voice", "city", "sword",
+)
+
+# Paired with their lowercase forms once; the fallback loop compares
+# against these instead of re-lowering every candidate per call.
+_FALLBACK_LOWER = tuple((w, w.lower()) for w in FALLBACK_DISTRACTORS)
+
+OPTION_LABELS = "abcd"
+NUM_DISTRACTORS = 3
+
+
+def split_line(s: str) -> tuple[str, str] | None:
+    """Split a vocab line into (term, gloss) at the earliest separator.
+
+    Separators are a tab, a colon, a spaced dash, or a run of two or more
+    spaces, with padding around the colon and dash absorbed into the
+    separator so `"aqua, aquae  -  water"` splits at the dash rather than
+    at the two-space run in front of it. The separator set is simple
+    enough that str.find calls beat dispatching into the regex engine,
+    which dominated per-line cost for short lines. Same semantics as
+    _LINE_RE, for a single already-split line.
+    """
+    n = len(s)
+    # (start, priority, end) per separator found; start includes any
+    # absorbed padding, priority breaks ties at equal starts the way the
+    # old pattern order did.
+    candidates = []
+    i = s.find("\t")
+    if i != -1:
+        candidates.append((i, 0, i + 1))
+    i = s.find(":")
+    if i != -1:
+        start, end = i, i + 1
+        while start > 0 and s[start - 1] == " ":
+            start -= 1
+        while end < n and s[end] == " ":
+            end += 1
+        candidates.append((start, 1, end))
+    i = s.find(" - ")
+    if i != -1:
+        start, end = i, i + 3
+        while start > 0 and s[start - 1] == " ":
+            start -= 1
+        while end < n and s[end] == " ":
+            end += 1
+        candidates.append((start, 2, end))
+    i = s.find("  ")
+    if i != -1:
+        end = i + 2
+        while end < n and s[end] == " ":
+            end += 1
+        candidates.append((i, 3, end))
+    if not candidates:
+        return None
+    start, _, end = min(candidates)
+    term, gloss = s[:start].strip(), s[end:].strip()
+    if term and gloss:
+        return term, gloss
+    return None
+
+
+def load_vocab(path: Path) -> list[tuple[str, str]]:
+    """Read (term, gloss) pairs, skipping comments and repeated terms.
+
+    The mapped file is scanned as bytes in one pass with a single compiled
+    alternation, which keeps the parse inside the C regex engine; only the
+    two matched slices of each accepted line are ever decoded, so skipped
+    lines cost no str allocation at all.
+    """
+    pairs: dict[str, str] = {}
+    with path.open("rb") as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty file
+            return []
+        with mm:
+            for m in _LINE_RE.finditer(mm):
+                term = m.group(1).strip().decode("utf-8")
+                gloss = m.group(2).strip().decode("utf-8")
+                if term and gloss:
+                    pairs.setdefault(term, gloss)
+    return list(pairs.items())
+
+
+def _rand_stream(rng: random.Random, chunk: int = 1024):
+    """Yield 30-bit random ints, refilling via one getrandbits call per chunk.
+
+    build_exam makes a handful of small draws per question; batching them
+    into a single big getrandbits call amortizes the per-call PRNG
+    overhead that rng.randrange would pay on every draw.
+    """
+    getrandbits = rng.getrandbits
+    while True:
+        bits = getrandbits(30 * chunk)
+        for _ in range(chunk):
+            yield bits & 0x3FFFFFFF
+            bits >>= 30
+
+
+def _pick3(
+    pool: list[str],
+    randrange,
+    exclude_lower: str,
+    k: int = NUM_DISTRACTORS,
+) -> list[str]:
+    """Draw k distinct pool entries by index, rejecting the excluded gloss.
+
+    For k much smaller than the pool, a few randrange draws with rejection
+    beat random.sample, which builds a selection set and a result list on
+    every call. Takes the rng's bound randrange so callers pay the
+    attribute lookup once, not per draw. Returns fewer than k picks only
+    if the attempt budget runs out on a pathological pool.
+    """
+    n = len(pool)
+    picked: list[str] = []
+    idxs: list[int] = []
+    attempts = 0
+    while len(picked) < k and attempts < 16 * k:
+        attempts += 1
+        i = randrange(n)
+        if i in idxs:
+            continue
+        g = pool[i]
+        if g.lower() == exclude_lower:
+            continue
+        idxs.append(i)
+        picked.append(g)
+    return picked
+
+
+def choose_distractors(
+    correct_eng: str,
+    pool: list[str],
+    randrange,
+    k: int = NUM_DISTRACTORS,
+) -> list[str]:
+    """Pick k wrong answers from the prebuilt gloss pool.
+
+    The pool is the deduplicated gloss list computed once per exam; each
+    call draws from it by index, rejecting the current correct answer,
+    instead of rebuilding a filtered set per question.
+    """
+    correct_lower = correct_eng.lower()
+    if len(pool) > k:
+        chosen = _pick3(pool, randrange, correct_lower, k)
+        if len(chosen) == k:
+            return chosen
+    # Tiny pools (or an exhausted attempt budget): filter, then top up
+    # from the fallbacks.
+    chosen = [g for g in pool if g.lower() != correct_lower]
+    chosen_set = {c.lower() for c in chosen}
+    for w, wl in _FALLBACK_LOWER:
+        if len(chosen) == k:
+            break
+        if wl != correct_lower and wl not in chosen_set:
+            chosen.append(w)
+            chosen_set.add(wl)
+    return chosen[:k]
+
+
+def build_exam(pairs: list[tuple[str, str]], rng: random.Random, title: str) -> str:
+    # One deduplicated gloss pool for the whole exam; each question only
+    # needs to exclude its own correct answer.
+    pool = list(dict.fromkeys(gloss for _, gloss in pairs))
+    # All per-question draws come out of one batched bit stream; 30-bit
+    # draws keep the modulo bias negligible for pool-sized ranges.
+    _next_rand = _rand_stream(rng).__next__
+
+    def _randrange(n: int) -> int:
+        return _next_rand() % n
+    # One flat line list joined once at the end; per-question blocks used
+    # to be joined separately, materializing an intermediate string each.
+    out_lines = [f"Title: {title}", ""]
+    append = out_lines.append
+    for number, (term, gloss) in enumerate(pairs, 1):
+        options = [gloss, *choose_distractors(gloss, pool, _randrange)]
+        # Fisher-Yates that tracks where the correct answer (index 0)
+        # lands, instead of shuffling and re-finding it with .index().
+        pos = 0
+        for i in range(len(options) - 1, 0, -1):
+            j = _randrange(i + 1)
+            options[i], options[j] = options[j], options[i]
+            if pos == i:
+                pos = j
+            elif pos == j:
+                pos = i
+        append(f"Question {number}: {term}")
+        for label, text in zip(OPTION_LABELS, options):
+            append(f"{label}. {text}")
+        append(f"Answer: {OPTION_LABELS[pos]}")
+        append("")
+    return "\n".join(out_lines).rstrip() + "\n"
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Turn a vocabulary list into an importable exam file."
+    )
+    parser.add_argument("vocab", type=Path, help="vocabulary list (term<sep>gloss per line)")
+    parser.add_argument("-o", "--output", type=Path, help="write the exam here instead of stdout")
+    parser.add_argument("--title", default="Vocabulary Exam", help="exam title for the Title: line")
+    parser.add_argument("--seed", type=int, default=None, help="seed for reproducible exams")
+    args = parser.parse_args(argv)
+
+    pairs = load_vocab(args.vocab)
+    if not pairs:
+        parser.error(f"no vocabulary entries found in {args.vocab}")
+    rng = random.Random(args.seed)
+    text = build_exam(pairs, rng, args.title)
+    if args.output:
+        args.output.write_text(text, encoding="utf-8")
+    else:
+        print(text, end="")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""Build an exam from a vocabulary list annotated with part-of-speech tags.
+
+Unlike mcq_generator.py, each input line carries a part-of-speech token after
+the gloss, e.g.:
+
+    amare : to love verb
+    puella, puellae : girl noun
+    celeriter : quickly adverb
+
+Distractors are drawn from entries with the same part of speech first — a
+verb prompt gets verb glosses as wrong answers — falling back to the rest of
+the vocabulary when a tag is underpopulated. Output uses the web app's
+import format (see README.md).
+
+Usage:
+    python tools/pythontxtparser.py vocab.txt -o exam.txt --title "Latin Vocabulary Exam"
+"""
+
+from __future__ import annotations
+
+import argparse
+import mmap
+import random
+import re
+import sys
+from pathlib import Path
+from typing import NamedTuple
+
+# Collapses space runs and tightens space-before-comma in a single pass,
+# instead of chaining str.replace calls that each rescan the string.
+_CLEAN_RE = re.compile(r" +(,)| {2,}")
+
+# Spaced dash between term and gloss, tolerant of extra padding.
+_DASH_RE = re.compile(r" +- +")
+
+# Interned so parsed tags share one string object per POS: hashing is
+# pointer-fast and the index keys compare by identity.
+POS_SET = frozenset(sys.intern(p) for p in (
+    "noun", "verb", "adjective", "adverb", "preposition",
+    "conjunction", "pronoun", "interjection", "numeral", "participle",
+))
+
+# One alternation over the known tags; parse_line keeps the last match,
+# so a single C-level scan replaces a manual right-to-left token walk.
+# The \b anchors stop tags from matching inside words ("verbs", "nouns").
+_POS_RE = re.compile(r"(?i)\b(" + "|".join(sorted(POS_SET)) + r")\b")
+
+OPTION_LABELS = "abcd"
+NUM_DISTRACTORS = 3
+
+
+def _clean(s: str) -> str:
+    return _CLEAN_RE.sub(lambda m: m.group(1) or " ", s).strip(" ,;")
+
+
+class Entry(NamedTuple):
+    """One parsed vocabulary line."""
+
+    latin: str
+    gloss: str
+    pos: str
+
+
+def parse_line(line: str) -> Entry | None:
+    """Parse one line into an Entry, or None to skip it."""
+    s = line.strip()
+    if not s or s.startswith("#"):
+        return None
+    # Single compiled-alternation scan for the POS tag; the last match
+    # wins, mirroring the old right-to-left walk.
+    last = None
+    for m in _POS_RE.finditer(s):
+        last = m
+    if last is None:
+        return None
+    pos = sys.intern(last.group(1).lower())
+    head = s[:last.start()].rstrip()
+    if ":" in head:
+        latin, _, gloss = head.partition(":")
+    else:
+        m = _DASH_RE.search(head)
+        if m is None:
+            return None
+        latin, gloss = head[:m.start()], head[m.end():]
+    latin = _clean(latin)
+    gloss = _clean(gloss)
+    if not latin or not gloss:
+        return None
+    return Entry(latin, gloss, pos)
+
+
+def load_and_index(
+    path: Path,
+) -> tuple[list[Entry], dict[str, int], list[str], dict[str, list[int]]]:
+    """Parse the file in a single pass, keeping the first entry per term.
+
+    Fills the entry list, the per-POS pools and the gloss id table
+    together, instead of re-walking the parsed entries once per derived
+    structure. Glosses are encoded as integer ids so the selection loops
+    hash and compare small ints rather than strings; gloss_list maps ids
+    back to their text.
+    """
+    entries: list[Entry] = []
+    seen_terms: set[str] = set()
+    gloss_ids: dict[str, int] = {}
+    gloss_list: list[str] = []
+    ids_by_pos: dict[str, list[int]] = {}
+    with path.open("rb") as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty file
+            return entries, gloss_ids, gloss_list, ids_by_pos
+        with mm:
+            size = len(mm)
+            off = 0
+            while off < size:
+                nl = mm.find(b"\n", off)
+                if nl == -1:
+                    nl = size
+                raw = mm[off:nl].strip()
+                off = nl + 1
+                # Fast reject on bytes: blank lines, comments and lines
+                # without a separator never reach the decoder.
+                if not raw or raw.startswith(b"#"):
+                    continue
+                if b":" not in raw and b"-" not in raw:
+                    continue
+                e = parse_line(raw.decode("utf-8"))
+                if e is None or e.latin in seen_terms:
+                    continue
+                seen_terms.add(e.latin)
+                entries.append(e)
+                gid = gloss_ids.get(e.gloss)
+                if gid is None:
+                    gid = gloss_ids[e.gloss] = len(gloss_list)
+                    gloss_list.append(e.gloss)
+                ids_by_pos.setdefault(e.pos, []).append(gid)
+    return entries, gloss_ids, gloss_list, ids_by_pos
+
+
+def _rand_stream(rng: random.Random, chunk: int = 1024):
+    """Yield 30-bit random ints, refilling via one getrandbits call per chunk.
+
+    The choice shuffle needs a few draws per question; batching them into
+    one big getrandbits call amortizes the per-call PRNG overhead across
+    the whole exam.
+    """
+    getrandbits = rng.getrandbits
+    while True:
+        bits = getrandbits(30 * chunk)
+        for _ in range(chunk):
+            yield bits & 0x3FFFFFFF
+            bits >>= 30
+
+
+def pick_distractors(
+    correct_id: int,
+    target_pos: str,
+    ids_by_pos: dict[str, list[int]],
+    backfill: list[int],
+    cursor: list[int],
+    rng: random.Random,
+    k: int = NUM_DISTRACTORS,
+) -> list[int]:
+    """Pick k wrong answers, preferring glosses with the same part of speech.
+
+    Works entirely on integer gloss ids: the per-POS id lists are
+    precomputed once in main, and a few randrange draws with rejection
+    pull k entries straight out of the shared list instead of copying and
+    shuffling a whole pool for every question.
+    """
+    distractors: list[int] = []
+    seen: set[int] = set()
+    pool_same = ids_by_pos.get(target_pos, ())
+    n = len(pool_same)
+    randrange = rng.randrange
+    attempts = 0
+    while n > 1 and len(distractors) < k and attempts < 16 * k:
+        attempts += 1
+        g = pool_same[randrange(n)]
+        if g != correct_id and g not in seen:
+            seen.add(g)
+            distractors.append(g)
+    if len(distractors) == k:
+        return distractors
+    # Underpopulated tag: consume the globally shuffled gloss list through
+    # the shared rolling cursor (wrapping at the end), instead of building
+    # and shuffling a filtered pool on every call.
+    i = cursor[0]
+    total = len(backfill)
+    scanned = 0
+    while len(distractors) < k and scanned < total:
+        g = backfill[i % total]
+        i += 1
+        scanned += 1
+        if g != correct_id and g not in seen:
+            seen.add(g)
+            distractors.append(g)
+    cursor[0] = i % total
+    return distractors
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Turn a POS-tagged vocabulary list into an importable exam file."
+    )
+    parser.add_argument("vocab", type=Path, help="vocabulary list (term : gloss pos per line)")
+    parser.add_argument("-o", "--output", type=Path, help="write the exam here instead of stdout")
+    parser.add_argument("--title", default="Vocabulary Exam", help="exam title for the Title: line")
+    parser.add_argument("--seed", type=int, default=None, help="seed for reproducible exams")
+    args = parser.parse_args(argv)
+
+    entries, gloss_ids, gloss_list, ids_by_pos = load_and_index(args.vocab)
+    if not entries:
+        parser.error(f"no vocabulary entries found in {args.vocab}")
+    rng = random.Random(args.seed)
+    # The backfill pool (every gloss id) is shuffled once and consumed
+    # through a rolling cursor shared across questions.
+    backfill = list(range(len(gloss_list)))
+    rng.shuffle(backfill)
+    cursor = [0]
+
+    # All shuffle draws come from one batched bit stream; 30-bit draws
+    # keep the modulo bias negligible for 4-element ranges.
+    _next_rand = _rand_stream(rng).__next__
+    # One flat line list joined once at the end; per-question blocks used
+    # to be joined separately, materializing an intermediate string each.
+    out_lines = [f"Title: {args.title}", ""]
+    append = out_lines.append
+    for number, e in enumerate(entries, 1):
+        correct_id = gloss_ids[e.gloss]
+        distractors = pick_distractors(
+            correct_id, e.pos, ids_by_pos, backfill, cursor, rng
+        )
+        choices = [correct_id, *distractors]
+        # Fisher-Yates that tracks where the correct answer (index 0)
+        # lands, instead of shuffling and re-finding it with .index().
+        pos = 0
+        for i in range(len(choices) - 1, 0, -1):
+            j = _next_rand() % (i + 1)
+            choices[i], choices[j] = choices[j], choices[i]
+            if pos == i:
+                pos = j
+            elif pos == j:
+                pos = i
+        append(f"Question {number}: {e.latin}")
+        for label, gid in zip(OPTION_LABELS, choices):
+            append(f"{label}. {gloss_list[gid]}")
+        append(f"Answer: {OPTION_LABELS[pos]}")
+        append("")
+    text = "\n".join(out_lines).rstrip() + "\n"
+
+    if args.output:
+        args.output.write_text(text, encoding="utf-8")
+    else:
+        print(text, end="")
+
+
+if __name__ == "__main__":
+    main()